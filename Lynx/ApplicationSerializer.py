@@ -1,4 +1,6 @@
+import codecs
 import datetime
+import functools
 import struct
 import sys
 import time
@@ -19,6 +21,33 @@ from .Exceptions import SerializationException
 from .MetaData import MetaData
 from .SerializableObject import SerializableObject
 
+#Precompiled little-endian packers shared by the serializer
+_S_Q = struct.Struct("<q")
+_S_I = struct.Struct("<i")
+_S_H = struct.Struct("<h")
+_S_B = struct.Struct("B")
+_S_b = struct.Struct("b")
+_S_F = struct.Struct("<f")
+_S_D = struct.Struct("<d")
+_S_UQ = struct.Struct("<Q")
+_S_UI = struct.Struct("<I")
+_S_UH = struct.Struct("<H")
+_S_META = MetaData.HEADER_STRUCT
+_BOOL_BYTES = (b"\x00", b"\x01")
+
+#Strings are UTF-16LE without a BOM, the codec functions skip the registry lookup
+_utf16le_enc = codecs.utf_16_le_encode
+_utf16le_dec = codecs.utf_16_le_decode
+
+#Win32 FILETIME epoch and the local timezone offset (uS), fixed at import
+_FILETIME_NULL = datetime.datetime(1601, 1, 1, 0, 0, 0)
+_TZ_US = time.timezone * 1000000
+_ONE_US = datetime.timedelta(microseconds=1)
+_timedelta = datetime.timedelta
+
+#Spectral data is polled repeatedly and its time stamps rarely change
+#between polls, so the converted values are shared
+@functools.lru_cache(maxsize=4096)
 def convertToLocalDate(val):
     """
     Description:
@@ -29,12 +58,7 @@ def convertToLocalDate(val):
     Returns:
         (datetime) The converted value
     """
-    _FILETIME_null_date = datetime.datetime(1601, 1, 1, 0, 0, 0)
-    timestamp = int(val)
-    val= _FILETIME_null_date + datetime.timedelta(microseconds=timestamp/10) - datetime.timedelta(seconds=time.timezone)
-    #if (1==time.daylight):
-    #    val += datetime.timedelta(seconds=3600)
-    return val
+    return _FILETIME_NULL + _timedelta(microseconds=(int(val)//10) - _TZ_US)
 def convertToLynxDate(val):
     """
     Description:
@@ -44,13 +68,40 @@ def convertToLynxDate(val):
     Returns:
         (long) The converted value
     """
-    _FILETIME_null_date = datetime.datetime(1601, 1, 1, 0, 0, 0)
-    res = val-_FILETIME_null_date + datetime.timedelta(seconds=time.timezone)
-    if (1==time.daylight):
-        res -= datetime.timedelta(seconds=3600)
-    return res.microseconds*10;    
+    return ((val - _FILETIME_NULL) // _ONE_US + _TZ_US) * 10
                         
                         
+class _Reader(object):
+    """
+    Description:
+        Read cursor over a received message.  Nested deserialize
+        calls share one instance and advance its offset instead of
+        slicing a new copy of the remaining stream on every field.
+    """
+    __slots__ = ('buf', 'off')
+    def __init__(self, buf, off=0):
+        """
+        Description:
+            Initializes this instance
+        Arguments:
+            buf    (in, memoryview) The message data
+            off    (in, int) The offset of the first unread byte
+        """
+        self.buf = buf
+        self.off = off
+    def read(self, n):
+        """
+        Description:
+            Returns the next n bytes and advances past them
+        Arguments:
+            n      (in, int) The number of bytes to read
+        Return:
+            (memoryview) The data
+        """
+        o = self.off
+        self.off = o + n
+        return self.buf[o:o + n]
+
 class ApplicationSerializer:    
     """
     Description:
@@ -60,6 +111,7 @@ class ApplicationSerializer:
         the consumer layer, Device class instance, will always
         return the correct data representation.
     """    
+    @staticmethod
     def getTypeCode(obj):
         """
         Description:
@@ -72,26 +124,19 @@ class ApplicationSerializer:
         Return:
             int    The type code see TypeCode class
         """
-        if (None == obj):
-            return TypeCode.Null
-        elif(isinstance(obj, bool)):
-            return TypeCode.Bool
-        elif (isinstance(obj, int)) :
-            return TypeCode.Uint;
-        elif(isinstance(obj, int)):
-            return TypeCode.Long
-        elif(isinstance(obj, float)):
-            return TypeCode.Double        
-        elif(isinstance(obj, str)):
-            return TypeCode.String
-        elif(isinstance(obj, datetime.datetime)):
-            return TypeCode.DateTime
+        code = _TYPECODE_BY_PY.get(type(obj))
+        if (code is not None):
+            return code
         elif(isinstance(obj, SerializableObject)):
             return obj.getType()
-        else:
-            raise SerializationException("Type not supported: %s" % type(obj))
-    getTypeCode = staticmethod(getTypeCode)
+        elif (obj is None):
+            return TypeCode.Null
+        for pyType, code in _TYPECODE_BY_PY.items():
+            if (isinstance(obj, pyType)):
+                return code
+        raise SerializationException("Type not supported: %s" % type(obj))
     
+    @staticmethod
     def getTypeSize(obj):
         """
         Description:
@@ -104,35 +149,31 @@ class ApplicationSerializer:
         Return:
             int    The size in bytes
         """
-        if (None == obj):
-            return 0
-        elif(isinstance(obj, bool)):
-            return 1
-        elif (isinstance(obj, int)) :
-            return 4
-        elif(isinstance(obj, int)):
-            return 8
-        elif(isinstance(obj, float)):
-            return 8        
-        elif(isinstance(obj, str)):
-            return len(obj.encode('utf_16_le'))
-        elif(isinstance(obj, datetime.datetime)):
-            return 8
+        size = _TYPESIZE_BY_PY.get(type(obj))
+        if (size is not None):
+            return size
         elif(isinstance(obj, SerializableObject)):
             return obj.getSize()    
-        else:
-            raise SerializationException('Type not supported: %s'%type(obj))          
+        elif(isinstance(obj, str)):
+            return len(_utf16le_enc(obj)[0])
+        elif (obj is None):
+            return 0
+        for pyType, size in _TYPESIZE_BY_PY.items():
+            if (isinstance(obj, pyType)):
+                return size
+        raise SerializationException('Type not supported: %s'%type(obj))          
         
-    getTypeSize = staticmethod(getTypeSize)
     
-    def serialize(obj, stream='', writeMeta=False, objTypeCode=None):
+    @staticmethod
+    def serialize(obj, stream=None, writeMeta=False, objTypeCode=None):
         """
         History:
             This method serializes the data contained
             in this instance into the stream
         Arguments:
             obj         (in, any) The data to serialize
-            stream      (in, char[]) The stream to append to
+            stream      (in, bytearray) The stream to append to.  This is
+                        optional.  If not supplied, a new buffer is created
             writeMeta   (in, bool) Flag to indicate metadata should be written
                         before the data value is written.  This is optional.
                         If not supplied, no metadata is written
@@ -146,46 +187,45 @@ class ApplicationSerializer:
                                 the additional stream data specified as via
                                 the method argument='stream'
         """        
+        if (stream is None):
+            stream = bytearray()
+        #Strings are encoded once, the size and the data share the result
+        encoded = None
+        if (isinstance(obj, str)):
+            encoded = _utf16le_enc(obj)[0]
         if (writeMeta):
-            metaData = MetaData(ApplicationSerializer.getTypeCode(obj), ApplicationSerializer.getTypeSize(obj))
-            stream += metaData.serialize()
-            
-        if (None == obj): pass
-        elif(isinstance(obj, bool) or (objTypeCode == TypeCode.Bool)):
-            if (obj is True) :
-                stream += struct.pack("B", 1)
+            metaTypeCode = ApplicationSerializer.getTypeCode(obj)
+            if (encoded is not None):
+                size = len(encoded)
             else:
-                stream += struct.pack("B", 0)
-        elif ((objTypeCode == TypeCode.Byte)) :
-            stream += struct.pack("b", obj)
-        elif ((objTypeCode == TypeCode.Ubyte)) :
-            stream += struct.pack("B", obj)
-        elif ((objTypeCode == TypeCode.Short) or (objTypeCode == TypeCode.Ushort)) :
-            stream += struct.pack("<h", obj)
-        elif (isinstance(obj, int) or (objTypeCode == TypeCode.Int) or (objTypeCode == TypeCode.Uint)) :
-            stream += struct.pack("<i", obj)        
-        elif(isinstance(obj, int) or (objTypeCode == TypeCode.Long) or (objTypeCode == TypeCode.Ulong)):
-            stream += struct.pack("<q", obj)
-        elif(objTypeCode == TypeCode.Float):
-            stream += struct.pack("<f", obj)    
-        elif(isinstance(obj, float) or (objTypeCode == TypeCode.Double)):
-            stream += struct.pack("<d", obj)        
-        elif(isinstance(obj, str) or (objTypeCode == TypeCode.String)):
+                size = ApplicationSerializer.getTypeSize(obj)
+            stream += _S_META.pack(metaTypeCode, size)
+            if (objTypeCode is None):
+                objTypeCode = metaTypeCode
+            
+        if (obj is None):
+            return stream
+        if (objTypeCode is None):
+            objTypeCode = ApplicationSerializer.getTypeCode(obj)
+        pack = _SERIALIZE.get(objTypeCode)
+        if (pack is not None):
+            try:
+                stream += pack(obj)
+            except (struct.error, OverflowError) as e:
+                raise SerializationException('Value %r not valid for type code %d: %s'%(obj, objTypeCode, e))
+        elif(TypeCode.DateTime == objTypeCode):
+            stream += _S_Q.pack(convertToLynxDate(obj))
+        elif(TypeCode.String == objTypeCode):
             if (writeMeta is False):
-                length = len(obj.encode('utf_16_le'))
-                stream += struct.pack("<i", length)            
-            stream += obj.encode('utf_16_le')
-            #stream += struct.pack("%ds"%length, obj.encode('utf-16'))
-        elif(isinstance(obj, datetime.datetime) or (objTypeCode == TypeCode.DateTime)):            
-            stream += struct.pack("<q", convertToLynxDate(obj))
+                stream += _S_I.pack(len(encoded))            
+            stream += encoded
         elif(isinstance(obj, SerializableObject)):
-            stream += obj.serialize()
-        elif(TypeCode.Null == type): pass  
-        else:
+            stream = obj.serialize(stream)
+        elif(TypeCode.Null != objTypeCode):
             raise SerializationException('Type not supported: %s'%type(obj))          
         return stream          
-    serialize = staticmethod(serialize)
     
+    @staticmethod
     def deserialize(stream, type=TypeCode.Unknown, size=0):
         """
         History:
@@ -199,107 +239,154 @@ class ApplicationSerializer:
             SerializationException.
         Return:
             [any, char[]] [The deserialized instance, The stream minus the deserialized data]
+                          When a _Reader is passed in, the same reader is returned
+                          advanced past the deserialized data
         """
-        if (TypeCode.Int == type):
-            data=struct.unpack("<i", stream[0:4])[0]
-            stream = stream[4:]            
-        elif(TypeCode.Uint == type):
-            data=struct.unpack("<I", stream[0:4])[0]
-            stream = stream[4:]  
-        elif(TypeCode.Long == type):
-            data = struct.unpack("<q", stream[0:8])[0]
-            stream = stream[8:]  
-        elif(TypeCode.Ulong == type):
-            data = struct.unpack("<Q", stream[0:8])[0]
-            stream = stream[8:]  
-        elif(TypeCode.Short == type):
-            data = struct.unpack("<h", stream[0:2])[0]
-            stream = stream[2:]   
-        elif(TypeCode.Ushort == type):
-            data = struct.unpack("<H", stream[0:2])[0]
-            stream = stream[2:]   
-        elif (TypeCode.Byte == type) :
-            data = struct.unpack("<b", stream[0:1])[0]
-            stream = stream[1:] 
-        elif (TypeCode.Ubyte == type) :
-            data = struct.unpack("<B", stream[0:1])[0]
-            stream = stream[1:]   
-        elif(TypeCode.Float == type):
-            data = struct.unpack("<f", stream[0:4])[0]
-            stream = stream[4:]    
-        elif(TypeCode.Double == type):
-            data = struct.unpack("<d", stream[0:8])[0]
-            stream = stream[8:]         
-        elif(TypeCode.Bool == type):
-            data = struct.unpack('<B', stream[0:1])[0]
-            if (0 == data):
-                data = False
-            else:
-                data = True
-            stream = stream[1:]
-        elif(TypeCode.Null == type):            
-            data = None
+        if (not isinstance(stream, _Reader)):
+            reader = _Reader(memoryview(stream))
+            data = ApplicationSerializer.deserialize(reader, type, size)[0]
+            return [data, stream[reader.off:]]
+        
+        #Checked roughly in order of frequency in spectral data traffic
+        unpacker = _DESERIALIZE.get(type)
+        if (unpacker is not None):
+            data = unpacker.unpack_from(stream.buf, stream.off)[0]
+            stream.off += unpacker.size
+        elif(type in _FACTORY):
+            data = _FACTORY[type]()
+            data.deserialize(stream)
+        elif(TypeCode.DateTime == type):
+            data = convertToLocalDate(_S_Q.unpack_from(stream.buf, stream.off)[0])
+            stream.off += 8
         elif(TypeCode.String == type):
             if (size > 0):
                 length = size
             else:
-                length = struct.unpack("<i", stream[0:4])[0]
-                stream = stream[4:]
-            data = stream[0:length]
-            data = data.decode('utf-16')
-            stream = stream[length:]
-        elif(TypeCode.DateTime == type):
-            ft = struct.unpack("<q", stream[0:8]) 
-            data = convertToLocalDate(ft[0])
-            stream = stream[8:]  
-        elif(TypeCode.SCAdefinitionData == type):
-            data = SCAdefinitions.SCAdefinitions()
-            stream = data.deserialize(stream)
-        elif(TypeCode.SCAbufferData == type):
-            data = SCAbuffer.SCAbuffer()
-            stream = data.deserialize(stream)
-        elif(TypeCode.CommandData == type):
-            data = Command.Command()
-            stream = data.deserialize(stream)
-        elif(TypeCode.ParameterData == type):
-            data = Parameter.Parameter()
-            stream = data.deserialize(stream)
-        elif(TypeCode.PhaData == type):
-            data = PhaData.PhaData()
-            stream = data.deserialize(stream)
-        elif(TypeCode.McsData == type):
-            data = McsData.McsData()
-            stream = data.deserialize(stream)
-        elif(TypeCode.DlfcData == type):
-            data = DlfcData.DlfcData()
-            stream = data.deserialize(stream)
-        elif(TypeCode.CounterData == type):
-            data = CounterData.CounterData()
-            stream = data.deserialize(stream)
-        elif(TypeCode.RegionOfInterestData == type):
-            data = RegionOfInterest.RegionOfInterest()
-            stream = data.deserialize(stream)
-        elif(TypeCode.ParameterMetaData == type):
-            data = ParameterAttributes.ParameterAttributes()
-            stream = data.deserialize(stream)
-        elif(TypeCode.ListData == type):
-            data = ListData.ListData()
-            stream = data.deserialize(stream)
-        elif(TypeCode.TlistData == type):
-            data = ListData.TlistData()
-            stream = data.deserialize(stream)
-        elif(TypeCode.SpectralData == type):
-            data = Spectrum.Spectrum()
-            stream = data.deserialize(stream)
+                length = _S_I.unpack_from(stream.buf, stream.off)[0]
+                stream.off += 4
+            data = _utf16le_dec(stream.read(length))[0]
+        elif(TypeCode.Bool == type):
+            data = (0 != stream.buf[stream.off])
+            stream.off += 1
+        elif(TypeCode.Null == type):            
+            data = None
         elif(TypeCode.Unknown == type):
             #Punt and assume there is metadata in the stream
-            metaData = MetaData()
-            stream = metaData.deserialize(stream)
-            return ApplicationSerializer.deserialize(stream, metaData.getDataType(), metaData.getDataSize())
+            [metaTypeCode, size] = _S_META.unpack_from(stream.buf, stream.off)
+            stream.off += _S_META.size
+            return ApplicationSerializer.deserialize(stream, metaTypeCode, size)
         else:
             raise SerializationException('Type not supported, Canberra Type Code: %d'%type)
         return [data, stream]
-    deserialize = staticmethod(deserialize)  
-        
-        
-        
\ No newline at end of file
+    
+    @staticmethod
+    def skip(stream, count):
+        """
+        History:
+            This method discards data from the stream
+        Arguments:
+            stream    (in, out, char[]) The stream
+            count     (in, int) The number of bytes to discard
+        Return:
+            char[]    The stream minus the discarded data
+        """
+        if (isinstance(stream, _Reader)):
+            stream.off += count
+            return stream
+        return stream[count:]
+    
+    @staticmethod
+    def read(stream, count):
+        """
+        History:
+            This method returns raw data from the stream without
+            copying it when possible
+        Arguments:
+            stream    (in, out, char[]) The stream
+            count     (in, int) The number of bytes to read
+        Return:
+            [buffer, char[]] [The data, The stream minus the data]
+        """
+        if (isinstance(stream, _Reader)):
+            return [stream.read(count), stream]
+        return [stream[0:count], stream[count:]]
+    
+    @staticmethod
+    def unpack(stream, packer):
+        """
+        History:
+            This method deserializes a fixed layout record from
+            the stream in a single call
+        Arguments:
+            stream    (in, out, char[]) The stream
+            packer    (in, struct.Struct) The record layout
+        Return:
+            [tuple, char[]] [The unpacked fields, The stream minus the deserialized data]
+        """
+        if (isinstance(stream, _Reader)):
+            data = packer.unpack_from(stream.buf, stream.off)
+            stream.off += packer.size
+            return [data, stream]
+        return [packer.unpack_from(stream), stream[packer.size:]]
+
+#Python type to Lynx type code/size, used by getTypeCode and getTypeSize
+_TYPECODE_BY_PY = {
+    bool: TypeCode.Bool,
+    int: TypeCode.Uint,
+    float: TypeCode.Double,
+    str: TypeCode.String,
+    datetime.datetime: TypeCode.DateTime,
+}
+_TYPESIZE_BY_PY = {
+    bool: 1,
+    int: 4,
+    float: 8,
+    datetime.datetime: 8,
+}
+
+#Type code to packer for the fixed size numeric types
+_SERIALIZE = {
+    TypeCode.Bool: lambda obj: _BOOL_BYTES[bool(obj)],
+    TypeCode.Byte: _S_b.pack,
+    TypeCode.Ubyte: _S_B.pack,
+    TypeCode.Short: _S_H.pack,
+    TypeCode.Ushort: _S_H.pack,
+    TypeCode.Int: _S_I.pack,
+    TypeCode.Uint: _S_I.pack,
+    TypeCode.Long: _S_Q.pack,
+    TypeCode.Ulong: _S_Q.pack,
+    TypeCode.Float: _S_F.pack,
+    TypeCode.Double: _S_D.pack,
+}
+
+#Type code to unpacker for the fixed size numeric types
+_DESERIALIZE = {
+    TypeCode.Int: _S_I,
+    TypeCode.Uint: _S_UI,
+    TypeCode.Long: _S_Q,
+    TypeCode.Ulong: _S_UQ,
+    TypeCode.Short: _S_H,
+    TypeCode.Ushort: _S_UH,
+    TypeCode.Byte: _S_b,
+    TypeCode.Ubyte: _S_B,
+    TypeCode.Float: _S_F,
+    TypeCode.Double: _S_D,
+}
+
+#Type code to constructor for the custom types.  The modules are resolved
+#at call time since they import this module themselves.
+_FACTORY = {
+    TypeCode.SCAdefinitionData: lambda: SCAdefinitions.SCAdefinitions(),
+    TypeCode.SCAbufferData: lambda: SCAbuffer.SCAbuffer(),
+    TypeCode.CommandData: lambda: Command.Command(),
+    TypeCode.ParameterData: lambda: Parameter.Parameter(),
+    TypeCode.PhaData: lambda: PhaData.PhaData(),
+    TypeCode.McsData: lambda: McsData.McsData(),
+    TypeCode.DlfcData: lambda: DlfcData.DlfcData(),
+    TypeCode.CounterData: lambda: CounterData.CounterData(),
+    TypeCode.RegionOfInterestData: lambda: RegionOfInterest.RegionOfInterest(),
+    TypeCode.ParameterMetaData: lambda: ParameterAttributes.ParameterAttributes(),
+    TypeCode.ListData: lambda: ListData.ListData(),
+    TypeCode.TlistData: lambda: ListData.TlistData(),
+    TypeCode.SpectralData: lambda: Spectrum.Spectrum(),
+}
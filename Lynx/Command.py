@@ -130,7 +130,7 @@ class Command(SerializableObject):
         for v in self.__args:
             cnt += ApplicationSerializer.ApplicationSerializer.getTypeSize(v)
         return cnt
-    def serializeData(self, stream=''):
+    def serializeData(self, stream=b''):
         """
         Description:
             Serializes all data contained in this instace into
@@ -140,11 +140,11 @@ class Command(SerializableObject):
         Returns:
             char[]    The stream containing the results
         """
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__commandCode)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__input, objTypeCode=TypeCode.Short)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(len(self.__args), objTypeCode=TypeCode.Short)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__commandCode, stream)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__input, stream, objTypeCode=TypeCode.Short)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(len(self.__args), stream, objTypeCode=TypeCode.Short)
         for v in self.__args:
-            stream += ApplicationSerializer.ApplicationSerializer.serialize(v, writeMeta=True)
+            stream = ApplicationSerializer.ApplicationSerializer.serialize(v, stream, writeMeta=True)
         return stream
     def deserializeData(self, stream):
         """
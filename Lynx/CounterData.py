@@ -140,13 +140,13 @@ class CounterSample(object):
         Returns:
             (char[]) The stream containing the serialized data
         """
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__startTime, objTypeCode=TypeCode.DateTime)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__elapsed, objTypeCode=TypeCode.Long)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(len(self.__attributes), objTypeCode=TypeCode.Short)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__startTime, stream, objTypeCode=TypeCode.DateTime)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__elapsed, stream, objTypeCode=TypeCode.Long)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(len(self.__attributes), stream, objTypeCode=TypeCode.Short)
         for i in range(0, len(self.__counts)):
-            stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__attributes[i].getUncorrectedValue())
-            stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__attributes[i].getValue())
-            stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__attributes[i].getFlags())
+            stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__attributes[i].getUncorrectedValue(), stream)
+            stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__attributes[i].getValue(), stream)
+            stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__attributes[i].getFlags(), stream)
 
 class CounterData(SerializableObject):
     """
@@ -201,13 +201,13 @@ class CounterData(SerializableObject):
             char[]    The stream containing the results
         """
         numSamps = len(self.__samples)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(numSamps, objTypeCode=TypeCode.Short)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(numSamps, stream, objTypeCode=TypeCode.Short)
         size=0
         if (numSamps > 0):
             size = self.__samples[0].getDataSize()
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(size, objTypeCode=TypeCode.Short)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(size, stream, objTypeCode=TypeCode.Short)
         for i in range(0, nSamps):
-            stream += self.__samples[i].serializeData()
+            stream = self.__samples[i].serializeData(stream)
         return stream
     def deserializeData(self, stream):
         """
@@ -245,6 +245,6 @@ class CounterData(SerializableObject):
                     attrs.append(CounterAttribute(val, uVal, flags))          
             samp=CounterSample(start, elapsed, attrs)
             if (bytesPerSamp > numRead):
-                stream = stream[(bytesPerSamp-numRead):]
+                stream = ApplicationSerializer.ApplicationSerializer.skip(stream, bytesPerSamp-numRead)
             self.__samples.append(samp)
         return stream
\ No newline at end of file
@@ -43,7 +43,7 @@ class DigitalSignature(Serializable):
             none
         """
         pass
-    def serialize(self, stream=''):
+    def serialize(self, stream=b''):
         """
         Description:
             Serializes the data into the stream
@@ -52,11 +52,11 @@ class DigitalSignature(Serializable):
         Returns:
             char[]    The serialized data and any addition info supplied in the stream
         """
-        stream+=ApplicationSerializer.ApplicationSerializer.serialize(len(self._Key))
-        stream+=ApplicationSerializer.ApplicationSerializer.serialize(len(self._Signature))
-        stream+=ApplicationSerializer.ApplicationSerializer.serialize(len(self._RandomData))
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(len(self._Key), stream)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(len(self._Signature), stream)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(len(self._RandomData), stream)
         for v in self._RandomData:
-            stream+=ApplicationSerializer.ApplicationSerializer.serialize(v, TypeCode.Byte)
+            stream = ApplicationSerializer.ApplicationSerializer.serialize(v, stream, objTypeCode=TypeCode.Byte)
         return stream
     def deserialize(self, stream):
         """
@@ -99,7 +99,7 @@ class ListDataBase(SerializableObject):
             (int)    The value
         """
         return 3*8 + 3*4        
-    def serializeData(self, stream=''):
+    def serializeData(self, stream=b''):
         """
         Description:
             Serializes all data contained in this instace into
@@ -109,11 +109,11 @@ class ListDataBase(SerializableObject):
         Returns:
             char[]    The stream containing the results
         """
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__startTime)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__realTime, objTypeCode=TypeCode.Long)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__liveTime, objTypeCode=TypeCode.Long)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__timeBase, objTypeCode=TypeCode.Int)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__flags, objTypeCode=TypeCode.Int)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__startTime, stream)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__realTime, stream, objTypeCode=TypeCode.Long)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__liveTime, stream, objTypeCode=TypeCode.Long)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__timeBase, stream, objTypeCode=TypeCode.Int)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__flags, stream, objTypeCode=TypeCode.Int)
         return stream
     def deserializeData(self, stream):
         """
@@ -169,7 +169,7 @@ class ListData(ListDataBase):
             (int)    The value
         """
         return ListDataBase.getDataSize(self) + len(self.__events)*2
-    def serializeData(self, stream=''):
+    def serializeData(self, stream=b''):
         """
         Description:
             Serializes all data contained in this instace into
@@ -179,10 +179,10 @@ class ListData(ListDataBase):
         Returns:
             char[]    The stream containing the results
         """
-        stream += ListDataBase.serializeData(self)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(len(self.__events))
+        stream = ListDataBase.serializeData(self, stream)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(len(self.__events), stream)
         for event in self.__events:                    
-            stream += ApplicationSerializer.ApplicationSerializer.serialize(event, objTypeCode=TypeCode.Ushort)
+            stream = ApplicationSerializer.ApplicationSerializer.serialize(event, stream, objTypeCode=TypeCode.Ushort)
         return stream
     def deserializeData(self, stream):
         """
@@ -284,7 +284,7 @@ class TlistData(ListDataBase):
             (int)    The value
         """
         return ListDataBase.getDataSize(self) + len(self.__events)*4
-    def serializeData(self, stream=''):
+    def serializeData(self, stream=b''):
         """
         Description:
             Serializes all data contained in this instace into
@@ -294,11 +294,11 @@ class TlistData(ListDataBase):
         Returns:
             char[]    The stream containing the results
         """
-        stream += ListDataBase.serializeData(self)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(len(self.__events))
+        stream = ListDataBase.serializeData(self, stream)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(len(self.__events), stream)
         for event in self.__events:                    
-            stream += ApplicationSerializer.ApplicationSerializer.serialize(event.event, objTypeCode=TypeCode.Ushort)
-            stream += ApplicationSerializer.ApplicationSerializer.serialize(event.time, objTypeCode=TypeCode.Ushort)
+            stream = ApplicationSerializer.ApplicationSerializer.serialize(event.event, stream, objTypeCode=TypeCode.Ushort)
+            stream = ApplicationSerializer.ApplicationSerializer.serialize(event.time, stream, objTypeCode=TypeCode.Ushort)
         return stream
     def deserializeData(self, stream):
         """
@@ -62,9 +62,9 @@ class McsData(SpectralData):
         Returns:
             char[]    The stream containing the results
         """
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__dwell, objTypeCode=TypeCode.Long)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__sweeps, objTypeCode=TypeCode.Long)
-        stream += SpectralData.serializeData(self)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__dwell, stream, objTypeCode=TypeCode.Long)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__sweeps, stream, objTypeCode=TypeCode.Long)
+        stream = SpectralData.serializeData(self, stream)
         return stream
     def deserializeData(self, stream):
         """
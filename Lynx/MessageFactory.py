@@ -40,21 +40,28 @@ class MessageFactory(object):
         if (isinstance(data, SerializableObject) is False):
             raise UnsupportedTypeException()
         
-        #Serialize the data
-        dataStream = ApplicationSerializer.ApplicationSerializer.serialize(data, writeMeta=True);
+        #The whole message is written into one buffer.  Space for the
+        #header is reserved up front and filled in once the size and
+        #CRC of the remainder are known.
+        msgHdr = MessageHeader()
+        hdrSize = msgHdr.getHeaderSize()
+        stream = bytearray(hdrSize)
         
-        #Sign the data and serialize the signature
-        DS = DigitalSignature(dataStream)
+        #Sign the data and serialize the signature.  Signing is not
+        #implemented by the Lynx, so the signature does not depend on
+        #the data and can be written ahead of it.
+        DS = DigitalSignature()
         DS.sign()
-        dsStream = DS.serialize()
-        crc = zlib.crc32(dsStream+dataStream)
+        stream = DS.serialize(stream)
         
-        #Create the message header and serialize it
-        msgHdr = MessageHeader(crc, len(dsStream)+len(dataStream))
-        hdrStream = msgHdr.serialize()
+        #Serialize the data
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(data, stream, writeMeta=True)
+        crc = zlib.crc32(memoryview(stream)[hdrSize:])
         
-        #Return the entire message serialized (sum of all parts)
-        return hdrStream+dsStream+dataStream
+        #Create the message header and serialize it
+        msgHdr = MessageHeader(crc, len(stream)-hdrSize)
+        stream[0:hdrSize] = msgHdr.serialize()
+        return stream
     serializeToMessage = staticmethod(serializeToMessage)
     def deserializeFromMessage(stream):
         """
@@ -69,6 +76,9 @@ class MessageFactory(object):
         Returns:
             [any, char[]]    [Data, the stream minus deserialized info]
         """
+        #Slicing a memoryview does not copy, so the header and signature
+        #can be peeled off without duplicating the (spectrum sized) payload
+        stream = memoryview(stream)
         msgHdr = MessageHeader()
         stream = msgHdr.deserialize(stream)
         if (MessageFactory.supportsMsgVersion(msgHdr.getVersion()) is False):
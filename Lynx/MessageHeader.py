@@ -64,7 +64,7 @@ class MessageHeader(Serializable):
         self.__Version=1
         self.__SequenceNumber=0
         self.__CRC=crc
-    def serialize(self, stream=''):
+    def serialize(self, stream=b''):
         """
         Description:
             Serializes all contained data into a stream
@@ -73,10 +73,12 @@ class MessageHeader(Serializable):
         Returns:
             char[]    The serialized data
         """
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__Size)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__Version)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__SequenceNumber)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__CRC)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__Size, stream)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__Version, stream)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__SequenceNumber, stream)
+        #The CRC32 is unsigned, write its bit pattern through the signed Int packer
+        crc = self.__CRC - 0x100000000 if (self.__CRC > 0x7FFFFFFF) else self.__CRC
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(crc, stream, objTypeCode=TypeCode.Int)
         return stream
     def deserialize(self, stream):
         """
@@ -90,7 +92,7 @@ class MessageHeader(Serializable):
         [self.__Size, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Int)
         [self.__Version, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Int)
         [self.__SequenceNumber, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Int)
-        [self.__CRC, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Int)
+        [self.__CRC, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Uint)
         return stream
         
                         
\ No newline at end of file
@@ -7,6 +7,8 @@ class MetaData(Serializable):
         An instance of this contains metadata about
         a Lynx data type
     """
+    #Wire layout: type code, data size
+    HEADER_STRUCT = struct.Struct("<ii")
     def __init__(self, type=0, size=0):
         """
         Description:
@@ -37,7 +39,7 @@ class MetaData(Serializable):
             The value
         """ 
         return self.__size
-    def serialize(self, stream=''):
+    def serialize(self, stream=b''):
         """
         History:
             This method serializes the data contained
@@ -47,7 +49,7 @@ class MetaData(Serializable):
         Return:
             none
         """
-        stream += struct.pack("<ii", self.__type, self.__size)
+        stream += MetaData.HEADER_STRUCT.pack(self.__type, self.__size)
         return stream
     def deserialize(self, stream):
         """
@@ -59,11 +61,8 @@ class MetaData(Serializable):
         Return:
             char[]    The stream minus the deserialized data
         """
-        v=stream[0:8]
-        data=struct.unpack("<ii", v)
-        self.__type = data[0]
-        self.__size = data[1]
-        stream=stream[8:]
+        [self.__type, self.__size] = MetaData.HEADER_STRUCT.unpack_from(stream)
+        stream=stream[MetaData.HEADER_STRUCT.size:]
         return stream
         
         
\ No newline at end of file
@@ -91,7 +91,7 @@ class Parameter(SerializableObject):
         cnt = 4
         cnt += ApplicationSerializer.ApplicationSerializer.getTypeSize(self.__value)
         return cnt
-    def serializeData(self, stream=''):
+    def serializeData(self, stream=b''):
         """
         Description:
             Serializes all data contained in this instace into
@@ -101,12 +101,12 @@ class Parameter(SerializableObject):
         Returns:
             char[]    The stream containing the results
         """
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__parameterCode, objTypeCode=TypeCode.Int)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__parameterCode, stream, objTypeCode=TypeCode.Int)
         typeCode = ApplicationSerializer.ApplicationSerializer.getTypeCode(self.__value)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(typeCode, objTypeCode=TypeCode.Int)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(typeCode, stream, objTypeCode=TypeCode.Int)
         if (TypeCode.String != typeCode):
-            stream += ApplicationSerializer.ApplicationSerializer.serialize(ApplicationSerializer.ApplicationSerializer.getTypeSize(self.__value), objTypeCode=TypeCode.Int)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__value)
+            stream = ApplicationSerializer.ApplicationSerializer.serialize(ApplicationSerializer.ApplicationSerializer.getTypeSize(self.__value), stream, objTypeCode=TypeCode.Int)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__value, stream)
         return stream
     def deserializeData(self, stream):
         """
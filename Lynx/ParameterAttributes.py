@@ -262,22 +262,24 @@ class ParameterAttributes(SerializableObject):
         Returns:
             char[]    The stream containing the results
         """        
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__code, objTypeCode=TypeCode.Int)
-        stream += ApplicationSerializer.serialize(self.__attr, objTypeCode=TypeCode.Int)
-        stream += ApplicationSerializer.serialize(self.__paramDataType, objTypeCode=TypeCode.Int)
-        stream += ApplicationSerializer.serialize(len(self.__enum), objTypeCode=TypeCode.Int)
-        stream += ApplicationSerializer.serialize(len(self.__min))
-        stream += ApplicationSerializer.serialize(len(self.__max))
-        stream += ApplicationSerializer.serialize(len(self.__def))
-        stream += ApplicationSerializer.serialize(len(self.__description))
-        stream += ApplicationSerializer.serialize(len(self.__name))
-        stream += ApplicationSerializer.serialize(len(self.__step))        
+        serialize = ApplicationSerializer.ApplicationSerializer.serialize
+        stream = serialize(self.__code, stream, objTypeCode=TypeCode.Int)
+        stream = serialize(self.__attr, stream, objTypeCode=TypeCode.Int)
+        stream = serialize(self.__paramDataType, stream, objTypeCode=TypeCode.Int)
+        stream = serialize(len(self.__enum), stream, objTypeCode=TypeCode.Int)
+        #These are read back with their metadata, see deserializeData
+        stream = serialize(self.__min, stream, writeMeta=True)
+        stream = serialize(self.__max, stream, writeMeta=True)
+        stream = serialize(self.__def, stream, writeMeta=True)
+        stream = serialize(self.__description, stream, writeMeta=True)
+        stream = serialize(self.__name, stream, writeMeta=True)
+        stream = serialize(self.__step, stream, writeMeta=True)
         for enum in self.__enum:
-             stream += ApplicationSerializer.serialize(enum)        
+             stream = serialize(enum, stream, writeMeta=True)
         for enum in self.__enumAttributes:
-             stream += ApplicationSerializer.serialize(enum.getName())
+             stream = serialize(enum.getName(), stream, writeMeta=True)
         for enum in self.__enumAttributes:
-             stream += ApplicationSerializer.serialize(enum.getNameId())
+             stream = serialize(enum.getNameId(), stream, writeMeta=True)
         return stream
     def deserializeData(self, stream):
         """
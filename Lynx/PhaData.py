@@ -2,6 +2,10 @@ from .SpectralData import SpectralData
 from .TypeCode import TypeCode
 from .Exceptions import UnsupportedCompressionException
 from . import ApplicationSerializer
+import struct
+
+#Live time, real time and computational value
+_PHA_HDR = struct.Struct("<qqq")
 
 class PhaData(SpectralData):
     """
@@ -74,11 +78,8 @@ class PhaData(SpectralData):
         Returns:
             char[]    The stream containing the results
         """
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__liveTime, objTypeCode=TypeCode.Long)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__realTime, objTypeCode=TypeCode.Long)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__compValue, objTypeCode=TypeCode.Long)
-        stream += SpectralData.serializeData(self)
-        return stream
+        stream += _PHA_HDR.pack(self.__liveTime, self.__realTime, self.__compValue)
+        return SpectralData.serializeData(self, stream)
     def deserializeData(self, stream):
         """
         Description:
@@ -89,8 +90,7 @@ class PhaData(SpectralData):
         Returns:
             char[]    The stream minus the deserialized data
         """
-        [self.__liveTime, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Long)
-        [self.__realTime, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Long)
-        [self.__compValue, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Long)
+        [hdr, stream] = ApplicationSerializer.ApplicationSerializer.unpack(stream, _PHA_HDR)
+        self.__liveTime, self.__realTime, self.__compValue = hdr
         return SpectralData.deserializeData(self, stream)
         
\ No newline at end of file
@@ -119,11 +119,11 @@ class SCAbuffer(SerializableObject):
                 Returns:
                     char[]    The stream containing the results
                 """                
-                stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__startTime)
-                stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__elapsedReal)
-                stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__elapsedLive)
-                stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__flags)
-                stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__spare)
+                stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__startTime, stream)
+                stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__elapsedReal, stream)
+                stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__elapsedLive, stream)
+                stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__flags, stream)
+                stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__spare, stream)
                 return stream
             def deserializeData(self, stream):
                 """
@@ -213,8 +213,8 @@ class SCAbuffer(SerializableObject):
                 Returns:
                     char[]    The stream containing the results
                 """                
-                stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__counts)
-                stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__flags)                
+                stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__counts, stream)
+                stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__flags, stream)
                 return stream
             def deserializeData(self, stream):
                 """
@@ -299,10 +299,10 @@ class SCAbuffer(SerializableObject):
             Returns:
                 char[]    The stream containing the results
             """        
-            stream += self.__header.serializeData(stream)
-            stream += ApplicationSerializer.ApplicationSerializer.serialize(len(self.__data), objTypeCode=TypeCode.Int)
+            stream = self.__header.serializeData(stream)
+            stream = ApplicationSerializer.ApplicationSerializer.serialize(len(self.__data), stream, objTypeCode=TypeCode.Int)
             for data in self.__data:              
-                stream += data.serializeData(stream)
+                stream = data.serializeData(stream)
             return stream
         def deserializeData(self, stream):
             """
@@ -395,9 +395,9 @@ class SCAbuffer(SerializableObject):
             Returns:
                 char[]    The stream containing the results
             """                
-            stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__startTime)
-            stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__flags)
-            stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__bytesPerSample)
+            stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__startTime, stream)
+            stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__flags, stream)
+            stream = ApplicationSerializer.ApplicationSerializer.serialize(self.__bytesPerSample, stream)
             return stream
         def deserializeData(self, stream):
             """
@@ -484,10 +484,10 @@ class SCAbuffer(SerializableObject):
         Returns:
             char[]    The stream containing the results
         """        
-        stream += self.__header.serializeData(stream)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(len(self.__entries), objTypeCode=TypeCode.Int)
+        stream = self.__header.serializeData(stream)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(len(self.__entries), stream, objTypeCode=TypeCode.Int)
         for entry in self.__entries:              
-            stream += entry.serializeData(stream)
+            stream = entry.serializeData(stream)
         return stream
     def deserializeData(self, stream):
         """
@@ -130,10 +130,10 @@ class SCAdefinitions(SerializableObject):
         Returns:
             char[]    The stream containing the results
         """        
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(len(self.__definitions), objTypeCode=TypeCode.Int)
+        stream = ApplicationSerializer.ApplicationSerializer.serialize(len(self.__definitions), stream, objTypeCode=TypeCode.Int)
         for defin in self.__definitions:              
-            stream += ApplicationSerializer.ApplicationSerializer.serialize(defin.getLLD(), objTypeCode=TypeCode.Float)
-            stream += ApplicationSerializer.ApplicationSerializer.serialize(defin.getULD(), objTypeCode=TypeCode.Float)
+            stream = ApplicationSerializer.ApplicationSerializer.serialize(defin.getLLD(), stream, objTypeCode=TypeCode.Float)
+            stream = ApplicationSerializer.ApplicationSerializer.serialize(defin.getULD(), stream, objTypeCode=TypeCode.Float)
         return stream
     def deserializeData(self, stream):
         """
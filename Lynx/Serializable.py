@@ -4,7 +4,7 @@ class Serializable(object):
         This is an abstract class used to define a
         common serialization interface
     """
-    def serialize(self, stream=''): 
+    def serialize(self, stream=b''): 
         """
         Description:
             This method serializes the data contained
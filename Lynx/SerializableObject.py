@@ -12,7 +12,7 @@ class SerializableObject(Serializable):
             int    Number of bytes
         """
         pass    
-    def serializeData(self, stream=''): 
+    def serializeData(self, stream=b''): 
         """
         Description:
             This method serializes the data contained
@@ -51,7 +51,7 @@ class SerializableObject(Serializable):
     """
     def __init__(self, type):
         self.__type=type
-    def serialize(self, stream=''):
+    def serialize(self, stream=b''):
         """
         Description:
             This method serializes the data contained
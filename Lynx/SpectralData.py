@@ -4,6 +4,10 @@ from .Spectrum import Spectrum
 from . import ApplicationSerializer
 from . import ParameterTypes
 import datetime
+import struct
+
+#Start time, status, input and memory group
+_SPECTRAL_HDR = struct.Struct("<qihh")
 
 class SpectralData(SerializableObject):
     def __init__(self, type):
@@ -92,11 +96,8 @@ class SpectralData(SerializableObject):
         Returns:
             char[]    The stream containing the results
         """
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__startTime)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__status)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__input, objTypeCode=TypeCode.Short)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__group, objTypeCode=TypeCode.Short)
-        stream += self.__spectrum.serialize()
+        stream += _SPECTRAL_HDR.pack(ApplicationSerializer.convertToLynxDate(self.__startTime), self.__status, self.__input, self.__group)
+        stream = self.__spectrum.serialize(stream)
         return stream
     def deserializeData(self, stream):
         """
@@ -108,9 +109,8 @@ class SpectralData(SerializableObject):
         Returns:
             char[]    The stream minus the deserialized data
         """
-        [self.__startTime, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.DateTime) 
-        [self.__status, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Int) 
-        [self.__input, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Short) 
-        [self.__group, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Short) 
+        [hdr, stream] = ApplicationSerializer.ApplicationSerializer.unpack(stream, _SPECTRAL_HDR)
+        startTime, self.__status, self.__input, self.__group = hdr
+        self.__startTime = ApplicationSerializer.convertToLocalDate(startTime)
         return self.__spectrum.deserialize(stream)
         
\ No newline at end of file
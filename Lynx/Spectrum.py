@@ -2,6 +2,13 @@ from .SerializableObject import SerializableObject
 from .TypeCode import TypeCode
 from .Exceptions import UnsupportedCompressionException
 from . import ApplicationSerializer
+import numpy as np
+import struct
+
+#Wire format of the spectrum counts
+_COUNT_DTYPE = np.dtype('<i4')
+#Encoding, number of channels and number of encoded counts
+_SPECTRUM_HDR = struct.Struct("<iii")
 
 class SpectrumEncodingType(object):
     """
@@ -32,7 +39,7 @@ class Spectrum(SerializableObject):
         SerializableObject.__init__(self, TypeCode.SpectralData)
         self.__encoding = SpectrumEncodingType.EncodingNone
         self.__numChannels = 0
-        self.__counts = []
+        self.__counts = np.empty(0, dtype=_COUNT_DTYPE)
     def getEncoding(self):
         """
         Description:
@@ -60,7 +67,7 @@ class Spectrum(SerializableObject):
         Arguments:
             none
         Return:
-            (int []) the value
+            (numpy.ndarray) the value
         """
         return self.__counts
     def getDataSize(self):
@@ -87,11 +94,8 @@ class Spectrum(SerializableObject):
         Returns:
             char[]    The stream containing the results
         """
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__encoding)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(self.__numChannels)
-        stream += ApplicationSerializer.ApplicationSerializer.serialize(len(self.__counts))
-        for cnt in self.__counts:
-            stream += ApplicationSerializer.ApplicationSerializer.serialize(cnt)
+        stream += _SPECTRUM_HDR.pack(self.__encoding, self.__numChannels, len(self.__counts))
+        stream += np.asarray(self.__counts, dtype=_COUNT_DTYPE).tobytes()
         return stream
     def deserializeData(self, stream):
        """
@@ -103,11 +107,8 @@ class Spectrum(SerializableObject):
         Returns:
             char[]    The stream containing the results
         """
-       self.__counts = []
-       [self.__encoding, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Int)
-       [self.__numChannels, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Int)
-       [numEncoded, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Int)
-       for i in range(0, self.__numChannels):
-           [cnt, stream] = ApplicationSerializer.ApplicationSerializer.deserialize(stream, TypeCode.Int)
-           self.__counts.append(cnt)
+       [hdr, stream] = ApplicationSerializer.ApplicationSerializer.unpack(stream, _SPECTRUM_HDR)
+       self.__encoding, self.__numChannels, numEncoded = hdr
+       [data, stream] = ApplicationSerializer.ApplicationSerializer.read(stream, self.__numChannels*_COUNT_DTYPE.itemsize)
+       self.__counts = np.frombuffer(data, dtype=_COUNT_DTYPE)
        return stream
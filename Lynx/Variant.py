@@ -61,7 +61,7 @@ class Variant(Serializable):
         cnt = 4
         cnt += ApplicationSerializer.getTypeSize(self.__value)
         return cnt
-    def serialize(self, stream=''):
+    def serialize(self, stream=b''):
         """
         Description:
             Serializes all data contained in this instace into
@@ -1,34 +1,73 @@
 import sys
+import os
 import json
 from datetime import datetime
 import traceback
+from contextlib import suppress
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 
-from PyQt5.QtCore import QTimer, QObject, Qt, pyqtSignal
-from PyQt5.QtWidgets import QApplication, QMainWindow, QDialog, QSplashScreen, QMessageBox
-from PyQt5.QtGui import QPixmap, QIcon, QGuiApplication
+from PyQt5.QtCore import QTimer, QObject, QThread, Qt, pyqtSignal, pyqtSlot
+from PyQt5.QtWidgets import QApplication, QMainWindow, QDialog, QProgressDialog, QMessageBox, QGraphicsItem
+from PyQt5.QtGui import QIcon
 from PyQt5 import uic
 
 import numpy as np
 import pyqtgraph as pg
 
 # import the Lynx device proxy and other resources
-from Lynx.DeviceFactory import *
-from Lynx.ParameterCodes import *
-from Lynx.CommandCodes import *
-from Lynx.ParameterTypes import *
-from Lynx.DlfcData import *
-from Lynx.PhaData import *
+from Lynx.DeviceFactory import DeviceFactory
+from Lynx.Parameter import Parameter
+from Lynx.ParameterCodes import ParameterCodes
+from Lynx.CommandCodes import CommandCodes
+from Lynx.ParameterTypes import PresetModes, StatusBits
+
+# orjson is optional, the stdlib json is used when it is not installed
+try:
+    import orjson
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+    _json_loads = json.loads
+
+# Device polling period while acquiring
+_ACQ_INTERVAL_MS = 100
+
+# Acquisition is still going while any of these bits is set
+_BUSY_MASK = StatusBits.Busy | StatusBits.Waiting
+
+# Decoded once on first use, a QApplication must exist by then
+@lru_cache(maxsize=None)
+def _icon():
+    return QIcon('res/icon.png')
+
+def _write_npy(path, y):
+    np.save(path, y)
+
+def _write_csv(path, y):
+    np.savetxt(path, np.column_stack([np.arange(y.size), y]), fmt='%d', delimiter=',')
 
 class Config:
     FILENAME = 'lynxnoveau_cfg.json'
+    # (mtime, dict) of the last parse, the file is only read again when it changes
+    _cache = None
+
     def __init__(self) -> None:
         # Read the config file / not using QT for this ... (simpler)
         self.config = self._read_cfg()
 
     def _read_cfg(self):
         try:
-            with open(Config.FILENAME, 'r') as cfg:
-                return json.load(cfg)
+            mtime = os.stat(Config.FILENAME).st_mtime
+            if Config._cache and Config._cache[0] == mtime:
+                return Config._cache[1]
+            with open(Config.FILENAME, 'rb') as cfg:
+                config = _json_loads(cfg.read())
+            Config._cache = (mtime, config)
+            return config
         except FileNotFoundError:
             print('Config file not found...')
         except Exception as e:
@@ -37,8 +76,10 @@ class Config:
     
     def _create_cfg(self, **kwargs):
         try:
-            with open(Config.FILENAME, 'w') as cfg:
-                return json.dump(kwargs, cfg)
+            with open(Config.FILENAME, 'wb') as cfg:
+                cfg.write(_json_dumps(kwargs))
+            Config._cache = (os.stat(Config.FILENAME).st_mtime, kwargs)
+            return kwargs
         except Exception as e:
             print(f'Could not create config file. Exception: {e}')
         return None
@@ -67,7 +108,7 @@ class ConfigWindow(QDialog):
         super(ConfigWindow, self).__init__(parent)
         self.ui = uic.loadUi('ui/ConfigWindow.ui', self)
 
-        self.setWindowIcon(QIcon('res/icon.png'))
+        self.setWindowIcon(_icon())
 
         self.config = Config()
         self._change_fields()
@@ -114,113 +155,173 @@ class ConfigWindow(QDialog):
         return self.config
 
 class DataHistogram(pg.PlotWidget):
-    def __init__(self, parent, num_channels=2048, poll_rate=5, background='default', plotItem=None, **kargs):
+    def __init__(self, parent, num_channels=2048, max_redraw_rate=2, background='default', plotItem=None, **kargs):
         super(DataHistogram, self).__init__(parent, background, plotItem, **kargs)
         parent.setCentralWidget(self)
 
-        self._x = np.arange(0, num_channels)
-        self._y = np.zeros(num_channels)
-        self.bars = pg.BarGraphItem(x=self._x, y1=self._y, width=0.5)
-        self.addItem(self.bars)
-
-        timer = QTimer(self)
-        timer.timeout.connect(self._update_data)
-        timer.start(1000 // poll_rate)
-
-    def change_y(self):
-        self._y = self.parent().get_live_y()
+        # Bin edges, each channel stays centered on its index
+        self._x_edges = np.arange(0, num_channels + 1) - 0.5
+        # The main window copies the counts straight into this buffer
+        self._y = np.zeros(num_channels, dtype=np.int32)
+        self.curve = pg.PlotCurveItem(x=self._x_edges, y=self._y, stepMode='center', fillLevel=0, brush=pg.getConfigOption('foreground'))
+        self.curve.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        self.addItem(self.curve)
+
+        # Bin start indices when several channels share a pixel, None draws every channel
+        self._ds_starts = None
+        self._ds_edges = None
+        self.getViewBox().sigXRangeChanged.connect(self._update_downsampling)
+        self.getViewBox().sigResized.connect(self._update_downsampling)
+
+        # Redraws run at their own pace, independent of the acquisition polling
+        self._dirty = False
+        self._redraw_timer = QTimer()
+        self._redraw_timer.setTimerType(Qt.CoarseTimer)
+        self._redraw_timer.timeout.connect(self._update_data)
+        self._redraw_timer.start(int(1000 / max_redraw_rate))
+
+    def set_num_channels(self, num_channels):
+        # Reallocates the shared buffer, callers must pick up the returned array
+        self._x_edges = np.arange(0, num_channels + 1) - 0.5
+        self._y = np.zeros(num_channels, dtype=np.int32)
+        self._ds_starts = None
+        self._update_downsampling()
+        self._dirty = True
+        return self._y
+
+    @pyqtSlot()
+    def set_dirty(self):
+        self._dirty = True
+
+    def _update_downsampling(self):
+        num_channels = self._y.size
+        view_box = self.getViewBox()
+        x_min, x_max = view_box.viewRange()[0]
+        visible = min(num_channels, max(1, int(x_max - x_min)))
+        factor = visible // max(1, int(view_box.width()))
+
+        if factor < 2:
+            self._ds_starts = None
+        elif self._ds_starts is None or self._ds_starts[1] != factor:
+            self._ds_starts = np.arange(0, num_channels, factor)
+            self._ds_edges = np.append(self._x_edges[self._ds_starts], self._x_edges[-1])
+        else:
+            return
+        self._dirty = True
 
     def _update_data(self):
-        self.bars.setOpts(y=self._y)
+        if self._dirty:
+            self._dirty = False
+            if self._ds_starts is None:
+                self.curve.setData(x=self._x_edges, y=self._y)
+            else:
+                # Keep the peak of each group so narrow lines don't vanish when zoomed out
+                self.curve.setData(x=self._ds_edges, y=np.maximum.reduceat(self._y, self._ds_starts))
 
-# This is like a friend class for the main window ... (just quick and dirty)
+# Busy indicator shown while connecting, it can't be dismissed with Esc or the close button
+class ConnectDialog(QProgressDialog):
+    def __init__(self, parent) -> None:
+        super(ConnectDialog, self).__init__('Attempting connection with hardware\nPlease wait...', None, 0, 0, parent)
+        self.setWindowTitle('Connecting')
+        self.setWindowModality(Qt.ApplicationModal)
+        # Closing emits canceled, which would hide the dialog through cancel()
+        self.canceled.disconnect(self.cancel)
+        # Don't pop up on its own, it is shown explicitly for each attempt
+        self.reset()
+
+    def reject(self):
+        pass
+
+# Connects and arms the device on a worker thread, results are reported back via signals
 class AsyncConnect(QObject):
-    exception = pyqtSignal()
+    finished = pyqtSignal()
+    error = pyqtSignal(str, str)
 
-    def run(self, lynx_window):
-        try:
-            lynx_window._acq_running = True
-            lynx_window.acq_set_running()
+    def __init__(self, lynx, config_options):
+        super(AsyncConnect, self).__init__()
+        self._lynx = lynx
+        self._config_options = config_options
 
-            if not lynx_window._lynx:
-                lynx_window._lynx = DeviceFactory.createInstance(DeviceFactory.DeviceInterface.IDevice)
-            config_options = lynx_window.configWindow.get_config().get_dict()
+    def run(self):
+        try:
+            lynx = self._lynx
+            config_options = self._config_options
+            input_mode = config_options['input_mode']
 
             ip_addr = config_options['connection_ip']
-            lynx_window._lynx.open('', ip_addr)
+            lynx.open('', ip_addr)
 
-            lynx_window._lynx.lock(config_options['username'], config_options['password'], config_options['input_mode'])
+            lynx.lock(config_options['username'], config_options['password'], input_mode)
             
-            try:
-                lynx_window._lynx.control(CommandCodes.Stop, config_options['input_mode'])
-            except:
-                pass
-            # Abort acquisition (only needed for MSS or MCS collections)
-            try:
-                lynx_window._lynx.control(CommandCodes.Abort, config_options['input_mode'])
-            except:
-                pass
-            # Stop SCA collection
-            try:
-                lynx_window._lynx.setParameter(ParameterCodes.Input_SCAstatus, 0, config_options['input_mode'])
-            except:
-                pass
-            # Stop Aux counter collection
-            try:
-                lynx_window._lynx.setParameter(ParameterCodes.Counter_Status, 0, config_options['input_mode'])
-            except:
-                pass
+            # Stop acquisition, abort is only needed for MSS or MCS collections
+            for command in (CommandCodes.Stop, CommandCodes.Abort):
+                with suppress(Exception):
+                    lynx.control(command, input_mode)
+            # Stop SCA and Aux counter collection
+            for code in (ParameterCodes.Input_SCAstatus, ParameterCodes.Counter_Status):
+                with suppress(Exception):
+                    lynx.setParameter(code, 0, input_mode)
             
-            lynx_window._lynx.setParameter(ParameterCodes.Input_Mode, 0, config_options['input_mode'])
-
+            # Input mode and preset go out in a single round trip
+            params = [Parameter(ParameterCodes.Input_Mode, 0)]
             if (PresetModes.PresetLiveTime == config_options['preset_mode']):
-                lynx_window._lynx.setParameter(ParameterCodes.Preset_Live, float(config_options['acq_time']), config_options['input_mode'])
+                params.append(Parameter(ParameterCodes.Preset_Live, float(config_options['acq_time'])))
             elif(PresetModes.PresetRealTime == config_options['preset_mode']):
-                lynx_window._lynx.setParameter(ParameterCodes.Preset_Real, float(config_options['acq_time']), config_options['input_mode'])
+                params.append(Parameter(ParameterCodes.Preset_Real, float(config_options['acq_time'])))
+            lynx.setParameterList(params, input_mode)
             
-            lynx_window._lynx.control(CommandCodes.Clear, config_options['input_mode'])
+            lynx.control(CommandCodes.Clear, input_mode)
 
             # TODO: Add HV control stuff
 
-            lynx_window._lynx.control(CommandCodes.Start, config_options['input_mode'])
+            lynx.control(CommandCodes.Start, input_mode)
 
-            lynx_window._acq_timer.start(100)
+            self.finished.emit()
 
         except Exception as e:
-            print(f'Exception caught. Details: {e}.')
-            print(traceback.format_exc())
+            tb = traceback.format_exc()
+            print(f'Exception caught. Details: {e}.\n{tb}')
 
-            msg = QMessageBox()
-            msg.setIcon(QMessageBox.Critical)
-            msg.setText("Exception caught. Details:")
-            msg.setInformativeText(f'{e}\n\nTraceback:\n{traceback.format_exc()}')
-            msg.setWindowTitle("Error")
-            msg.exec_()
-
-            self.exception.emit() # Just reset the buttons on the menu
+            # Widgets can't be touched from here, the main window shows the error
+            self.error.emit(str(e), tb)
 
 
 class LynxNoveauMainWindow(QMainWindow):
+    counts_changed = pyqtSignal()
+    save_failed = pyqtSignal(str, str)
+
     def __init__(self) -> None:
         super(LynxNoveauMainWindow, self).__init__()
         self.ui = uic.loadUi('ui/LynxNoveauMainWindow.ui', self)
 
-        self.setWindowIcon(QIcon('res/icon.png'))
+        self.setWindowIcon(_icon())
 
         # Setup other windows
         self.configWindow = ConfigWindow(self)
         
         # Setup graph
-        self.graph = DataHistogram(self, num_channels=2048, poll_rate=5)
+        config_options = self.configWindow.get_config().get_dict()
+        num_channels = config_options['num_channels'] if config_options else 2048
+        poll_rate = config_options['poll_rate'] if config_options else 2.0
+        self.graph = DataHistogram(self, num_channels=num_channels, max_redraw_rate=poll_rate)
+        # Shared with the graph, no copies between acquisition and drawing
+        self._live_y = self.graph._y
+        self.counts_changed.connect(self.graph.set_dirty)
+        self.save_failed.connect(self._save_failed)
 
         # Some internal variables
         self._acq_running = False
         self._lynx = None
+        self._connect_thread = None
+        self._connect_worker = None
+        self._connect_dialog = None
+        self._error_box = None
         self._acq_timer = QTimer()
+        self._acq_timer.setTimerType(Qt.PreciseTimer)
         self._acq_timer.timeout.connect(self._handle_acq)
-        self._acq_timer.timeout.connect(self.graph.change_y)
-        self._acq_time = (0.0, 0.0)
-        self._live_y = np.zeros(2048)
+        self._cfg_input_mode = None
+        self._cfg_acq_group = None
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
 
         # Disable stuff at the start
         if self.configWindow.get_config().empty():
@@ -237,9 +338,6 @@ class LynxNoveauMainWindow(QMainWindow):
         # Finally draw the window
         self.show()
 
-    def get_live_y(self):
-        return self._live_y
-
     def acq_set_ready(self):
         self.ui.actionStart.setEnabled(True)
         self.ui.actionStop.setEnabled(False)
@@ -251,17 +349,67 @@ class LynxNoveauMainWindow(QMainWindow):
         self.ui.actionPause.setEnabled(True)
 
     def _start_acq(self):
+        # A previous attempt may still be blocked in the device
+        if self._connect_thread:
+            return
         if not self._acq_running:
-            # Try a synchronous task to see if the error persists
-            async_worker = AsyncConnect()
-            async_worker.exception.connect(self._stop_acq)
-
-            curr_screen = QGuiApplication.screenAt(self.pos())
-            splash_screen = QSplashScreen(curr_screen, QPixmap('res/splash.png'))
-            splash_screen.show()
-            splash_screen.showMessage('Attempting connection with hardware\nPlease wait...', Qt.AlignHCenter | Qt.AlignBottom)
-            async_worker.run(self)
-            splash_screen.close()
+            self._acq_running = True
+            self.acq_set_running()
+
+            if not self._lynx:
+                self._lynx = DeviceFactory.createInstance(DeviceFactory.DeviceInterface.IDevice)
+            config_options = self.configWindow.get_config().get_dict()
+            self._cfg_input_mode = config_options['input_mode']
+            self._cfg_acq_group = config_options['acq_group']
+
+            # Indeterminate busy indicator, the event loop keeps running while connecting
+            if not self._connect_dialog:
+                self._connect_dialog = ConnectDialog(self)
+            self._connect_dialog.show()
+
+            # The device calls block, keep them off the GUI thread
+            self._connect_thread = QThread()
+            self._connect_worker = AsyncConnect(self._lynx, dict(config_options))
+            self._connect_worker.moveToThread(self._connect_thread)
+            self._connect_thread.started.connect(self._connect_worker.run)
+            self._connect_worker.finished.connect(self._connect_thread.quit)
+            self._connect_worker.error.connect(self._connect_thread.quit)
+            self._connect_worker.finished.connect(self._connect_done)
+            self._connect_worker.error.connect(self._connect_failed)
+            self._connect_thread.finished.connect(self._connect_worker.deleteLater)
+            self._connect_thread.finished.connect(self._connect_thread.deleteLater)
+            self._connect_thread.finished.connect(self._connect_cleanup)
+            self._connect_thread.start()
+
+    @pyqtSlot()
+    def _connect_cleanup(self):
+        # Both objects are deleted by deleteLater, just drop the references
+        self._connect_thread = None
+        self._connect_worker = None
+
+    @pyqtSlot()
+    def _connect_done(self):
+        self._connect_dialog.hide()
+        # Stop may have been pressed while connecting
+        if self._acq_running:
+            self._acq_timer.start(_ACQ_INTERVAL_MS)
+
+    @pyqtSlot(str, str)
+    def _connect_failed(self, error, tb):
+        self._connect_dialog.hide()
+
+        self._show_error(error, tb)
+
+        self._stop_acq() # Just reset the buttons on the menu
+
+    def _show_error(self, error, tb):
+        if not self._error_box:
+            self._error_box = QMessageBox(self)
+            self._error_box.setIcon(QMessageBox.Critical)
+            self._error_box.setText("Exception caught. Details:")
+            self._error_box.setWindowTitle("Error")
+        self._error_box.setInformativeText(f'{error}\n\nTraceback:\n{tb}')
+        self._error_box.exec_()
             
     def _stop_acq(self):
         if self._acq_running:
@@ -271,20 +419,47 @@ class LynxNoveauMainWindow(QMainWindow):
             self.acq_set_ready()
             self._display_msg('Ready.')
 
-    def _save_spectrum(self):
-        now = datetime.now()
-        with open(f'{now}.csv', 'w') as file:
-            file.writelines([','.join([n, y])+',' for n, y in enumerate(self._live_y)])
+    def _save_spectrum(self, csv=False):
+        # str(datetime) has ':' which is not allowed in Windows filenames
+        name = datetime.now().strftime('%Y%m%d_%H%M%S')
+        # Write a snapshot off the GUI thread, _live_y keeps being reused
+        if csv:
+            path, writer = name + '.csv', _write_csv
+        else:
+            path, writer = name + '.npy', _write_npy
+        future = self._io_pool.submit(writer, path, self._live_y.copy())
+        future.add_done_callback(lambda f: self._check_saved(path, f))
+
+    def _check_saved(self, path, future):
+        # Runs on the I/O thread, the signal hands the error to the GUI thread
+        e = future.exception()
+        if e:
+            tb = ''.join(traceback.format_exception(type(e), e, e.__traceback__))
+            print(f'Could not save spectrum to {path}. Details: {e}.\n{tb}')
+            self.save_failed.emit(f'Could not save spectrum to {path}: {e}', tb)
+
+    @pyqtSlot(str, str)
+    def _save_failed(self, error, tb):
+        self._display_msg(error)
+        self._show_error(error, tb)
 
     def _handle_acq(self):
-        config_options = self.configWindow.get_config().get_dict()
-        spectral_data = self._lynx.getSpectralData(config_options['input_mode'], config_options['acq_group'])
-        self._acq_time = (spectral_data.getLiveTime(), spectral_data.getRealTime())
-        self._live_y = spectral_data.getSpectrum().getCounts()
-
-        if ((0 == (StatusBits.Busy & spectral_data.getStatus())) and (0 == (StatusBits.Waiting & spectral_data.getStatus()))):
+        spectral_data = self._lynx.getSpectralData(self._cfg_input_mode, self._cfg_acq_group)
+        counts = spectral_data.getSpectrum().getCounts()
+        live_y = self._live_y
+        # The device channel count is not set from the config, follow what it sends
+        if (counts.shape != live_y.shape):
+            self._display_msg(f'Device reports {counts.size} channels, resizing from {live_y.size}.')
+            live_y = self._live_y = self.graph.set_num_channels(counts.size)
+        # Only redraw when the spectrum actually changed
+        if not np.array_equal(counts, live_y):
+            np.copyto(live_y, counts, casting='unsafe')
+            self.counts_changed.emit()
+
+        status = spectral_data.getStatus()
+        if (0 == (_BUSY_MASK & status)):
             self._stop_acq()
-            self._save_spectrum()
+            self._save_spectrum(csv=self.ui.actionSaveCsv.isChecked())
 
     def _display_msg(self, msg):
         self.statusBar().showMessage(msg)